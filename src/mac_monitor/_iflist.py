@@ -0,0 +1,128 @@
+"""
+Direct routing-socket sysctl bindings for per-interface packet counters
+without spawning netstat -i.
+
+Counters come from sysctl NET_RT_IFLIST2, whose if_msghdr2 messages carry
+struct if_data64 with the same 64-bit counters netstat -i reports (the
+if_data that getifaddrs exposes is only 32-bit and wraps on busy links).
+
+Importing this module raises OSError when libSystem is unavailable (i.e. on
+anything other than macOS), so callers can fall back to the netstat command.
+The struct layouts below are the macOS ones.
+"""
+import ctypes
+import errno
+import socket
+import sys
+
+_libc = ctypes.CDLL("/usr/lib/libSystem.B.dylib", use_errno=True)
+
+CTL_NET = 4
+PF_ROUTE = 17
+NET_RT_IFLIST2 = 6
+RTM_IFINFO2 = 0x12
+
+
+class IfDataTimeval(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int32),
+        ("tv_usec", ctypes.c_int32),
+    ]
+
+
+class IfData64(ctypes.Structure):
+    _fields_ = [
+        ("ifi_type", ctypes.c_ubyte),
+        ("ifi_typelen", ctypes.c_ubyte),
+        ("ifi_physical", ctypes.c_ubyte),
+        ("ifi_addrlen", ctypes.c_ubyte),
+        ("ifi_hdrlen", ctypes.c_ubyte),
+        ("ifi_recvquota", ctypes.c_ubyte),
+        ("ifi_xmitquota", ctypes.c_ubyte),
+        ("ifi_unused1", ctypes.c_ubyte),
+        ("ifi_mtu", ctypes.c_uint32),
+        ("ifi_metric", ctypes.c_uint32),
+        ("ifi_baudrate", ctypes.c_uint64),
+        ("ifi_ipackets", ctypes.c_uint64),
+        ("ifi_ierrors", ctypes.c_uint64),
+        ("ifi_opackets", ctypes.c_uint64),
+        ("ifi_oerrors", ctypes.c_uint64),
+        ("ifi_collisions", ctypes.c_uint64),
+        ("ifi_ibytes", ctypes.c_uint64),
+        ("ifi_obytes", ctypes.c_uint64),
+        ("ifi_imcasts", ctypes.c_uint64),
+        ("ifi_omcasts", ctypes.c_uint64),
+        ("ifi_iqdrops", ctypes.c_uint64),
+        ("ifi_noproto", ctypes.c_uint64),
+        ("ifi_recvtiming", ctypes.c_uint32),
+        ("ifi_xmittiming", ctypes.c_uint32),
+        ("ifi_lastchange", IfDataTimeval),
+    ]
+
+
+class IfMsghdr2(ctypes.Structure):
+    _fields_ = [
+        ("ifm_msglen", ctypes.c_ushort),
+        ("ifm_version", ctypes.c_ubyte),
+        ("ifm_type", ctypes.c_ubyte),
+        ("ifm_addrs", ctypes.c_int),
+        ("ifm_flags", ctypes.c_int),
+        ("ifm_index", ctypes.c_ushort),
+        ("ifm_snd_len", ctypes.c_int),
+        ("ifm_snd_maxlen", ctypes.c_int),
+        ("ifm_snd_drops", ctypes.c_int),
+        ("ifm_timer", ctypes.c_int),
+        ("ifm_data", IfData64),
+    ]
+
+
+_libc.sysctl.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.c_uint, ctypes.c_void_p,
+                         ctypes.POINTER(ctypes.c_size_t), ctypes.c_void_p, ctypes.c_size_t]
+_libc.sysctl.restype = ctypes.c_int
+
+_MIB = (ctypes.c_int * 6)(CTL_NET, PF_ROUTE, 0, 0, NET_RT_IFLIST2, 0)
+
+
+def read_iflist():
+    """Return the raw NET_RT_IFLIST2 routing messages."""
+    while True:
+        size = ctypes.c_size_t(0)
+        if _libc.sysctl(_MIB, len(_MIB), None, ctypes.byref(size), None, 0) != 0:
+            raise OSError(ctypes.get_errno(), "sysctl NET_RT_IFLIST2 failed")
+        buf = ctypes.create_string_buffer(size.value)
+        if _libc.sysctl(_MIB, len(_MIB), buf, ctypes.byref(size), None, 0) == 0:
+            return buf.raw[:size.value]
+        if ctypes.get_errno() != errno.ENOMEM:
+            raise OSError(ctypes.get_errno(), "sysctl NET_RT_IFLIST2 failed")
+        # An interface appeared between the two calls; size the buffer again
+
+
+def interface_counters():
+    """Return link-level packet, error and collision counters keyed by interface name."""
+    data = read_iflist()
+    interfaces = {}
+    offset = 0
+    while offset + 4 <= len(data):
+        # Every routing message starts with its u_short length and u_char type at byte 3
+        msglen = int.from_bytes(data[offset:offset + 2], sys.byteorder)
+        if msglen == 0:
+            break
+        # Interface messages are followed by address messages we don't need
+        if data[offset + 3] == RTM_IFINFO2 and msglen >= ctypes.sizeof(IfMsghdr2):
+            header = IfMsghdr2.from_buffer_copy(data, offset)
+            try:
+                name = socket.if_indextoname(header.ifm_index)
+            except OSError:
+                # Interface went away after the snapshot
+                name = None
+            if name is not None:
+                stats = header.ifm_data
+                interfaces[name] = {
+                    "packets_in": stats.ifi_ipackets,
+                    "errors_in": stats.ifi_ierrors,
+                    "packets_out": stats.ifi_opackets,
+                    "errors_out": stats.ifi_oerrors,
+                    "collisions": stats.ifi_collisions
+                }
+        offset += msglen
+    return interfaces
@@ -0,0 +1,202 @@
+"""
+Direct libproc bindings for reading the process table without spawning ps.
+
+Importing this module raises OSError when libproc is unavailable (i.e. on
+anything other than macOS), so callers can fall back to the ps command.
+"""
+import ctypes
+import time
+
+_libproc = ctypes.CDLL("/usr/lib/libproc.dylib", use_errno=True)
+_libc = ctypes.CDLL("/usr/lib/libSystem.B.dylib", use_errno=True)
+
+PROC_ALL_PIDS = 1
+PROC_PIDTASKALLINFO = 2
+PROC_PIDPATHINFO_MAXSIZE = 4096
+MAXCOMLEN = 16
+
+
+class ProcBSDInfo(ctypes.Structure):
+    _fields_ = [
+        ("pbi_flags", ctypes.c_uint32),
+        ("pbi_status", ctypes.c_uint32),
+        ("pbi_xstatus", ctypes.c_uint32),
+        ("pbi_pid", ctypes.c_uint32),
+        ("pbi_ppid", ctypes.c_uint32),
+        ("pbi_uid", ctypes.c_uint32),
+        ("pbi_gid", ctypes.c_uint32),
+        ("pbi_ruid", ctypes.c_uint32),
+        ("pbi_rgid", ctypes.c_uint32),
+        ("pbi_svuid", ctypes.c_uint32),
+        ("pbi_svgid", ctypes.c_uint32),
+        ("rfu_1", ctypes.c_uint32),
+        ("pbi_comm", ctypes.c_char * MAXCOMLEN),
+        ("pbi_name", ctypes.c_char * (2 * MAXCOMLEN)),
+        ("pbi_nfiles", ctypes.c_uint32),
+        ("pbi_pgid", ctypes.c_uint32),
+        ("pbi_pjobc", ctypes.c_uint32),
+        ("e_tdev", ctypes.c_uint32),
+        ("e_tpgid", ctypes.c_uint32),
+        ("pbi_nice", ctypes.c_int32),
+        ("pbi_start_tvsec", ctypes.c_uint64),
+        ("pbi_start_tvusec", ctypes.c_uint64),
+    ]
+
+
+class ProcTaskInfo(ctypes.Structure):
+    _fields_ = [
+        ("pti_virtual_size", ctypes.c_uint64),
+        ("pti_resident_size", ctypes.c_uint64),
+        ("pti_total_user", ctypes.c_uint64),
+        ("pti_total_system", ctypes.c_uint64),
+        ("pti_threads_user", ctypes.c_uint64),
+        ("pti_threads_system", ctypes.c_uint64),
+        ("pti_policy", ctypes.c_int32),
+        ("pti_faults", ctypes.c_int32),
+        ("pti_pageins", ctypes.c_int32),
+        ("pti_cow_faults", ctypes.c_int32),
+        ("pti_messages_sent", ctypes.c_int32),
+        ("pti_messages_received", ctypes.c_int32),
+        ("pti_syscalls_mach", ctypes.c_int32),
+        ("pti_syscalls_unix", ctypes.c_int32),
+        ("pti_csw", ctypes.c_int32),
+        ("pti_threadnum", ctypes.c_int32),
+        ("pti_numrunning", ctypes.c_int32),
+        ("pti_priority", ctypes.c_int32),
+    ]
+
+
+class ProcTaskAllInfo(ctypes.Structure):
+    _fields_ = [
+        ("pbsd", ProcBSDInfo),
+        ("ptinfo", ProcTaskInfo),
+    ]
+
+
+class MachTimebaseInfo(ctypes.Structure):
+    _fields_ = [
+        ("numer", ctypes.c_uint32),
+        ("denom", ctypes.c_uint32),
+    ]
+
+
+_libproc.proc_listpids.argtypes = [ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p, ctypes.c_int]
+_libproc.proc_listpids.restype = ctypes.c_int
+_libproc.proc_pidinfo.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_uint64, ctypes.c_void_p, ctypes.c_int]
+_libproc.proc_pidinfo.restype = ctypes.c_int
+_libproc.proc_pidpath.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint32]
+_libproc.proc_pidpath.restype = ctypes.c_int
+_libc.sysctlbyname.argtypes = [ctypes.c_char_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_size_t),
+                               ctypes.c_void_p, ctypes.c_size_t]
+_libc.sysctlbyname.restype = ctypes.c_int
+_libc.mach_timebase_info.argtypes = [ctypes.POINTER(MachTimebaseInfo)]
+_libc.mach_timebase_info.restype = ctypes.c_int
+
+# pti_total_user/pti_total_system are reported in Mach absolute time units,
+# which are only nanoseconds on Intel; Apple Silicon needs the timebase ratio.
+_timebase = MachTimebaseInfo()
+_libc.mach_timebase_info(ctypes.byref(_timebase))
+_TICKS_TO_NS = _timebase.numer / _timebase.denom
+
+# Last CPU time seen per pid, used to report recent rather than lifetime usage
+_last_cpu_sample = {}
+
+
+def sysctl_uint64(name):
+    """Read an integer sysctl value such as hw.memsize."""
+    value = ctypes.c_uint64(0)
+    size = ctypes.c_size_t(ctypes.sizeof(value))
+    if _libc.sysctlbyname(name.encode(), ctypes.byref(value), ctypes.byref(size), None, 0) != 0:
+        raise OSError(ctypes.get_errno(), f"sysctlbyname({name}) failed")
+    return value.value
+
+
+_PHYSICAL_MEMORY = sysctl_uint64("hw.memsize")
+
+
+def list_pids():
+    """Return the pids of every process currently on the system."""
+    size = _libproc.proc_listpids(PROC_ALL_PIDS, 0, None, 0)
+    if size <= 0:
+        raise OSError(ctypes.get_errno(), "proc_listpids failed")
+    buf = (ctypes.c_int * (size // ctypes.sizeof(ctypes.c_int)))()
+    size = _libproc.proc_listpids(PROC_ALL_PIDS, 0, buf, ctypes.sizeof(buf))
+    if size <= 0:
+        raise OSError(ctypes.get_errno(), "proc_listpids failed")
+    return [pid for pid in buf[:size // ctypes.sizeof(ctypes.c_int)] if pid > 0]
+
+
+def count_pids():
+    """Return the number of processes without reading any per-process info."""
+    return len(list_pids())
+
+
+def task_all_info(pid):
+    """Return the proc_taskallinfo struct for pid, or None if it cannot be read."""
+    info = ProcTaskAllInfo()
+    size = _libproc.proc_pidinfo(pid, PROC_PIDTASKALLINFO, 0, ctypes.byref(info), ctypes.sizeof(info))
+    if size != ctypes.sizeof(info):
+        return None
+    return info
+
+
+def pid_path(pid):
+    """Return the executable path of pid, or an empty string if unavailable."""
+    buf = ctypes.create_string_buffer(PROC_PIDPATHINFO_MAXSIZE)
+    if _libproc.proc_pidpath(pid, buf, PROC_PIDPATHINFO_MAXSIZE) <= 0:
+        return ""
+    return buf.value.decode("utf-8", "replace")
+
+
+def list_processes(make_record=lambda *fields: fields):
+    """
+    Snapshot every readable process in a single pass.
+
+    Each process is built with make_record(pid, cpu_percent, memory_percent,
+    resident_memory_kb, command), a plain tuple by default, so callers can
+    construct their own record type without an intermediate dict.
+
+    Returns (processes, unreadable_pids): the records, and the pids whose task
+    info cannot be read (typically other users' processes when not running as
+    root), which callers need to read some other way. CPU usage is measured
+    since the previous call for pids seen before, otherwise averaged over the
+    process lifetime.
+    """
+    now = time.time()
+    processes = []
+    unreadable = []
+    seen = {}
+
+    for pid in list_pids():
+        info = task_all_info(pid)
+        if info is None:
+            unreadable.append(pid)
+            continue
+
+        task = info.ptinfo
+        cpu_ns = (task.pti_total_user + task.pti_total_system) * _TICKS_TO_NS
+        seen[pid] = (now, cpu_ns)
+
+        previous = _last_cpu_sample.get(pid)
+        if previous is not None and now > previous[0] and cpu_ns >= previous[1]:
+            elapsed_ns = (now - previous[0]) * 1e9
+            cpu_ns_used = cpu_ns - previous[1]
+        else:
+            start = info.pbsd.pbi_start_tvsec + info.pbsd.pbi_start_tvusec / 1e6
+            elapsed_ns = (now - start) * 1e9
+            cpu_ns_used = cpu_ns
+
+        cpu_percent = round(cpu_ns_used / elapsed_ns * 100, 1) if elapsed_ns > 0 else 0.0
+        command = pid_path(pid) or info.pbsd.pbi_comm.decode("utf-8", "replace")
+
+        processes.append(make_record(
+            str(pid),
+            cpu_percent,
+            round(task.pti_resident_size / _PHYSICAL_MEMORY * 100, 1),
+            task.pti_resident_size // 1024,
+            command
+        ))
+
+    _last_cpu_sample.clear()
+    _last_cpu_sample.update(seen)
+    return processes, unreadable
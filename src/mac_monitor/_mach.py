@@ -0,0 +1,167 @@
+"""
+Direct Mach host statistics bindings for memory and CPU counters without
+spawning vm_stat or top.
+
+Importing this module raises OSError when the Mach APIs are unavailable
+(i.e. on anything other than macOS), so callers can fall back to the commands.
+"""
+import ctypes
+
+_libc = ctypes.CDLL("/usr/lib/libSystem.B.dylib")
+
+KERN_SUCCESS = 0
+HOST_VM_INFO64 = 4
+PROCESSOR_CPU_LOAD_INFO = 2
+CPU_STATE_USER = 0
+CPU_STATE_SYSTEM = 1
+CPU_STATE_IDLE = 2
+CPU_STATE_NICE = 3
+CPU_STATE_MAX = 4
+
+
+class VMStatistics64(ctypes.Structure):
+    _fields_ = [
+        ("free_count", ctypes.c_uint32),
+        ("active_count", ctypes.c_uint32),
+        ("inactive_count", ctypes.c_uint32),
+        ("wire_count", ctypes.c_uint32),
+        ("zero_fill_count", ctypes.c_uint64),
+        ("reactivations", ctypes.c_uint64),
+        ("pageins", ctypes.c_uint64),
+        ("pageouts", ctypes.c_uint64),
+        ("faults", ctypes.c_uint64),
+        ("cow_faults", ctypes.c_uint64),
+        ("lookups", ctypes.c_uint64),
+        ("hits", ctypes.c_uint64),
+        ("purges", ctypes.c_uint64),
+        ("purgeable_count", ctypes.c_uint32),
+        ("speculative_count", ctypes.c_uint32),
+        ("decompressions", ctypes.c_uint64),
+        ("compressions", ctypes.c_uint64),
+        ("swapins", ctypes.c_uint64),
+        ("swapouts", ctypes.c_uint64),
+        ("compressor_page_count", ctypes.c_uint32),
+        ("throttled_count", ctypes.c_uint32),
+        ("external_page_count", ctypes.c_uint32),
+        ("internal_page_count", ctypes.c_uint32),
+        ("total_uncompressed_pages_in_compressor", ctypes.c_uint64),
+    ]
+
+
+HOST_VM_INFO64_COUNT = ctypes.sizeof(VMStatistics64) // ctypes.sizeof(ctypes.c_int)
+
+_libc.mach_host_self.argtypes = []
+_libc.mach_host_self.restype = ctypes.c_uint
+_libc.host_page_size.argtypes = [ctypes.c_uint, ctypes.POINTER(ctypes.c_size_t)]
+_libc.host_page_size.restype = ctypes.c_int
+_libc.host_statistics64.argtypes = [ctypes.c_uint, ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
+_libc.host_statistics64.restype = ctypes.c_int
+_libc.host_processor_info.argtypes = [ctypes.c_uint, ctypes.c_int, ctypes.POINTER(ctypes.c_uint),
+                                      ctypes.POINTER(ctypes.POINTER(ctypes.c_uint)),
+                                      ctypes.POINTER(ctypes.c_uint)]
+_libc.host_processor_info.restype = ctypes.c_int
+_libc.vm_deallocate.argtypes = [ctypes.c_uint, ctypes.c_size_t, ctypes.c_size_t]
+_libc.vm_deallocate.restype = ctypes.c_int
+
+# mach_host_self() hands out a new port right on every call, so take one up front
+_host = _libc.mach_host_self()
+_task = ctypes.c_uint.in_dll(_libc, "mach_task_self_").value
+
+# Field name in vm_statistics64 -> key produced by parsing the matching vm_stat line
+_VM_STAT_KEYS = {
+    "free_count": "pages_free",
+    "active_count": "pages_active",
+    "inactive_count": "pages_inactive",
+    "speculative_count": "pages_speculative",
+    "throttled_count": "pages_throttled",
+    "wire_count": "pages_wired_down",
+    "purgeable_count": "pages_purgeable",
+    "external_page_count": "file-backed_pages",
+    "internal_page_count": "anonymous_pages",
+    "total_uncompressed_pages_in_compressor": "pages_stored_in_compressor",
+    "compressor_page_count": "pages_occupied_by_compressor",
+    # Event counters; vm_stat quotes the "Translation faults" label, hence the key
+    "faults": '"translation_faults"',
+    "cow_faults": "pages_copy-on-write",
+    "zero_fill_count": "pages_zero_filled",
+    "reactivations": "pages_reactivated",
+    "purges": "pages_purged",
+    "decompressions": "decompressions",
+    "compressions": "compressions",
+    "pageins": "pageins",
+    "pageouts": "pageouts",
+    "swapins": "swapins",
+    "swapouts": "swapouts",
+}
+
+# Total (user, system, idle) ticks from the previous cpu_usage() call
+_last_cpu_ticks = None
+
+
+def page_size():
+    """Return the VM page size in bytes (16384 on Apple Silicon, 4096 on Intel)."""
+    size = ctypes.c_size_t(0)
+    if _libc.host_page_size(_host, ctypes.byref(size)) != KERN_SUCCESS:
+        raise OSError("host_page_size failed")
+    return size.value
+
+
+def vm_page_counts():
+    """Return page counts keyed the same way as the parsed vm_stat output."""
+    stats = VMStatistics64()
+    count = ctypes.c_uint(HOST_VM_INFO64_COUNT)
+    if _libc.host_statistics64(_host, HOST_VM_INFO64, ctypes.byref(stats), ctypes.byref(count)) != KERN_SUCCESS:
+        raise OSError("host_statistics64 failed")
+    counts = {key: getattr(stats, field) for field, key in _VM_STAT_KEYS.items()}
+    # vm_stat's "Pages free" excludes speculative pages, which it lists separately
+    counts["pages_free"] -= stats.speculative_count
+    return counts
+
+
+def cpu_ticks():
+    """Return (user, system, idle) ticks summed over all CPUs since boot; nice counts as user."""
+    cpu_count = ctypes.c_uint(0)
+    info = ctypes.POINTER(ctypes.c_uint)()
+    info_count = ctypes.c_uint(0)
+    if _libc.host_processor_info(_host, PROCESSOR_CPU_LOAD_INFO, ctypes.byref(cpu_count),
+                                 ctypes.byref(info), ctypes.byref(info_count)) != KERN_SUCCESS:
+        raise OSError("host_processor_info failed")
+
+    try:
+        user = system = idle = 0
+        for cpu in range(cpu_count.value):
+            base = cpu * CPU_STATE_MAX
+            user += info[base + CPU_STATE_USER] + info[base + CPU_STATE_NICE]
+            system += info[base + CPU_STATE_SYSTEM]
+            idle += info[base + CPU_STATE_IDLE]
+        return user, system, idle
+    finally:
+        address = ctypes.cast(info, ctypes.c_void_p).value
+        _libc.vm_deallocate(_task, address, info_count.value * ctypes.sizeof(ctypes.c_uint))
+
+
+def cpu_usage():
+    """
+    Return user/system/idle CPU percentages since the previous call.
+
+    The first call reports the average since boot.
+    """
+    global _last_cpu_ticks
+
+    ticks = cpu_ticks()
+    previous = _last_cpu_ticks or (0, 0, 0)
+    _last_cpu_ticks = ticks
+
+    deltas = [now - before for now, before in zip(ticks, previous)]
+    total = sum(deltas)
+    if total <= 0:
+        # No ticks elapsed since the last call; fall back to the since-boot average
+        deltas = list(ticks)
+        total = sum(deltas)
+
+    user, system, idle = (round(delta / total * 100, 2) for delta in deltas)
+    return {
+        'user_percent': user,
+        'system_percent': system,
+        'idle_percent': idle
+    }
@@ -7,10 +7,132 @@ import subprocess
 import json
 import re
 import logging
-from mcp.server.fastmcp import FastMCP
+import time
+import functools
+import heapq
+import importlib
+import math
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from operator import attrgetter, itemgetter
 
-# Initialize the MCP server
-mcp = FastMCP("Simple MacOS Resource Monitor")
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def import_binding(name):
+    """
+    Import one of the ctypes binding modules, or return None if it cannot load here.
+
+    The bindings raise OSError when the macOS libraries are missing. When this
+    file is run as a script (python src/mac_monitor/monitor.py) the package is
+    not importable, but the bindings are alongside it on sys.path.
+    """
+    try:
+        try:
+            return importlib.import_module(f"mac_monitor.{name}")
+        except ModuleNotFoundError as e:
+            if e.name not in ("mac_monitor", f"mac_monitor.{name}"):
+                raise
+            return importlib.import_module(name)
+    except OSError:
+        return None
+
+# libproc is macOS-only; fall back to parsing ps output elsewhere
+_libproc = import_binding("_libproc")
+# Mach host statistics are macOS-only; fall back to top and vm_stat
+_mach = import_binding("_mach")
+# Routing-socket interface counters are macOS-only; fall back to netstat -i
+_iflist = import_binding("_iflist")
+
+# MCP server, created on first use by get_mcp() so importing this module for
+# its helpers does not pull in FastMCP and its dependency tree
+_mcp = None
+
+# Process types and sort fields accepted by get_processes_by_category
+# (tuples keep the order used in error messages)
+_VALID_PROCESS_TYPES = ('cpu', 'memory', 'network')
+_VALID_SORT_FIELDS = {
+    'cpu': ('auto', 'cpu_percent', 'pid', 'command'),
+    'memory': ('auto', 'memory_percent', 'resident_memory_kb', 'pid', 'command'),
+    'network': ('auto', 'network_connections', 'pid', 'command')
+}
+
+# Default ('auto') sort field for each process type
+_AUTO_SORT_FIELDS = {
+    'cpu': 'cpu_percent',
+    'memory': 'memory_percent',
+    'network': 'network_connections'
+}
+
+# Precompiled parsers for ps, top, uptime and vm_stat output
+# (ps and vm_stat are matched against undecoded bytes)
+# ps -eo pid,%cpu,pmem,rss,comm
+_PS_RE = re.compile(rb'^\s*(\d+)\s+([\d.]+)\s+([\d.]+)\s+(\d+)\s+(.+)$', re.MULTILINE)
+_CPU_USAGE_RE = re.compile(r'CPU usage:\s*([\d.]+)% user,\s*([\d.]+)% sys,\s*([\d.]+)% idle')
+_LOAD_AVG_RE = re.compile(r'Load Avg:\s*([\d.]+),\s*([\d.]+),\s*([\d.]+)')
+# macOS prints "load averages: 1.92 2.06 2.17", other systems comma-separate them
+_UPTIME_LOAD_RE = re.compile(r'load averages?:\s*([\d.]+),?\s+([\d.]+),?\s+([\d.]+)')
+_UPTIME_USERS_RE = re.compile(r'(\d+) users?')
+_VM_STAT_RE = re.compile(rb'^([^:\n]+):\s+(\d+)\.?$', re.MULTILINE)
+_VM_STAT_PAGE_SIZE_RE = re.compile(rb'page size of (\d+) bytes')
+
+# VM page size (16384 on Apple Silicon, 4096 on Intel)
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+
+# Apps commonly behind high memory usage; helper processes match too, since
+# their names and paths contain the app name (e.g. "Google Chrome Helper")
+_MEMORY_HOG_RE = re.compile(r'Chrome|Electron|Slack|Teams|Discord')
+# Only apps holding at least this share of memory are worth a recommendation,
+# and at most this many of them
+_MEMORY_HOG_MIN_PERCENT = 5.0
+_MEMORY_HOG_LIMIT = 3
+
+@dataclass(slots=True)
+class ProcessRecord:
+    """One row of the process snapshot; projected onto view dicts only for output."""
+    pid: str
+    cpu_percent: float
+    memory_percent: float
+    resident_memory_kb: int
+    command: str
+
+# TTLs (seconds) for cached probes: dynamic stats vs values fixed while running
+DYNAMIC_TTL = 2
+STATIC_TTL = 3600
+
+# Cached probe results keyed by (function name, *args, *kwargs) -> (expires_at, value)
+_cache = {}
+# Per-key locks so concurrent callers share one refresh instead of racing
+_cache_locks = {}
+
+def cached(ttl):
+    """Decorator caching a function's result per argument tuple for ttl seconds."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__name__,) + args + tuple(sorted(kwargs.items()))
+            entry = _cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            with _cache_locks.setdefault(key, threading.Lock()):
+                # Another thread may have refreshed the entry while we waited
+                entry = _cache.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    return entry[1]
+                value = func(*args, **kwargs)
+                _cache[key] = (time.monotonic() + ttl, value)
+                return value
+        return wrapper
+    return decorator
 
 def safe_call(func, error_prefix="Operation failed"):
     """Helper for safe function calls with consistent error format"""
@@ -19,30 +141,59 @@ def safe_call(func, error_prefix="Operation failed"):
     except Exception as e:
         return {"error": f"{error_prefix}: {str(e)}"}
 
+def to_json(data, pretty=False):
+    """Serialize a tool response, using orjson's C encoder when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+# Full sorts keyed by (process_type, sort_by, sort_order) -> (snapshot, sorted rows);
+# an entry is only reused while its snapshot is still the current cached one
+_sorted_cache = {}
+
+# (monotonic time, read bytes, write bytes) from the previous read_psutil_disk_io() call
+_last_disk_io = None
+
+# Shared pool for running independent, subprocess-bound probes concurrently
+_executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix="mac-monitor")
+
+def gather_calls(calls):
+    """Run (key, func, error_prefix) probes concurrently via safe_call, keyed by name."""
+    futures = {key: _executor.submit(safe_call, func, error_prefix) for key, func, error_prefix in calls}
+    return {key: future.result() for key, future in futures.items()}
+
 # ===== MCP Tool for Process Monitoring =====
-@mcp.tool()
-def get_resource_intensive_processes() -> str:
+@cached(DYNAMIC_TTL)
+def get_resource_intensive_processes(pretty: bool = False) -> str:
     """
     Identify resource-intensive processes on macOS across CPU, memory, and network.
 
+    When only one category is needed, get_processes_by_category is cheaper since
+    it skips the other probes; use get_system_overview for disk statistics.
+
+    Args:
+        pretty: Indent the JSON output (default: False, compact output)
+
     Returns:
         A string containing information about resource-intensive processes,
         which can be analyzed to provide optimization suggestions.
     """
-    # Get system resource data with per-category error handling
-    system_data = {
-        "cpu_intensive_processes": safe_call(get_cpu_intensive_processes, "CPU monitoring failed"),
-        "memory_intensive_processes": safe_call(get_memory_intensive_processes, "Memory monitoring failed"),
-        "network_intensive_processes": safe_call(get_network_intensive_processes, "Network monitoring failed")
-    }
+    # Get system resource data concurrently with per-category error handling
+    system_data = gather_calls([
+        ("cpu_intensive_processes", get_cpu_intensive_processes, "CPU monitoring failed"),
+        ("memory_intensive_processes", get_memory_intensive_processes, "Memory monitoring failed"),
+        ("network_intensive_processes", get_network_intensive_processes, "Network monitoring failed")
+    ])
 
-    # Format the results as a nice JSON string
-    result = json.dumps(system_data, indent=2)
+    # Format the results as a JSON string
+    result = to_json(system_data, pretty=pretty)
     return result
 
-@mcp.tool()
 def get_processes_by_category(process_type: str, page: int = 1, page_size: int = 10, 
-                            sort_by: str = "auto", sort_order: str = "desc") -> str:
+                            sort_by: str = "auto", sort_order: str = "desc",
+                            pretty: bool = False) -> str:
     """
     Get all processes filtered by category (cpu, memory, network) with pagination and sorting support.
     
@@ -55,16 +206,16 @@ def get_processes_by_category(process_type: str, page: int = 1, page_size: int =
                  Memory: 'auto'/'memory_percent', 'resident_memory_kb', 'pid', 'command'  
                  Network: 'auto'/'network_connections', 'pid', 'command'
         sort_order: Sort direction - 'desc' (default) or 'asc'
+        pretty: Indent the JSON output (default: False, compact output)
     
     Returns:
         JSON string containing paginated and sorted process information for the specified category
     """
     try:
         # Validate inputs
-        valid_types = ['cpu', 'memory', 'network']
-        if process_type.lower() not in valid_types:
-            return json.dumps({
-                "error": f"Invalid process_type '{process_type}'. Must be one of: {', '.join(valid_types)}"
+        if process_type.lower() not in _VALID_PROCESS_TYPES:
+            return to_json({
+                "error": f"Invalid process_type '{process_type}'. Must be one of: {', '.join(_VALID_PROCESS_TYPES)}"
             })
         
         if page < 1:
@@ -77,41 +228,34 @@ def get_processes_by_category(process_type: str, page: int = 1, page_size: int =
         
         # Validate sort parameters
         sort_order = sort_order.lower()
-        if sort_order not in ['asc', 'desc']:
+        if sort_order not in ('asc', 'desc'):
             sort_order = 'desc'
             
         sort_by = sort_by.lower()
         
-        # Define valid sort fields for each process type
-        valid_sort_fields = {
-            'cpu': ['auto', 'cpu_percent', 'pid', 'command'],
-            'memory': ['auto', 'memory_percent', 'resident_memory_kb', 'pid', 'command'],
-            'network': ['auto', 'network_connections', 'pid', 'command']
-        }
-        
         process_type = process_type.lower()
-        if sort_by not in valid_sort_fields[process_type]:
-            return json.dumps({
-                "error": f"Invalid sort_by '{sort_by}' for {process_type} processes. Valid options: {', '.join(valid_sort_fields[process_type])}"
+        if sort_by not in _VALID_SORT_FIELDS[process_type]:
+            return to_json({
+                "error": f"Invalid sort_by '{sort_by}' for {process_type} processes. Valid options: {', '.join(_VALID_SORT_FIELDS[process_type])}"
             })
         
-        # Get all processes for the specified type
-        if process_type == 'cpu':
-            all_processes = get_all_cpu_processes()
-        elif process_type == 'memory':
-            all_processes = get_all_memory_processes()
-        elif process_type == 'network':
-            all_processes = get_all_network_processes()
-            
-        # Apply custom sorting if not using default
-        if sort_by != 'auto':
-            all_processes = sort_processes(all_processes, process_type, sort_by, sort_order)
+        # Get processes for the specified type in the requested order, with the
+        # total taken from the same snapshot
+        start_index = (page - 1) * page_size
+        total_processes, all_processes = get_sorted_processes(
+            process_type, sort_by, sort_order, start_index + page_size
+        )
         
         # Calculate pagination
-        total_processes = len(all_processes)
-        start_index = (page - 1) * page_size
         end_index = min(start_index + page_size, total_processes)
-        paginated_processes = all_processes[start_index:end_index]
+        
+        # Only materialize the view fields for the requested page
+        if process_type == 'cpu':
+            paginated_processes = [to_cpu_process(p) for p in all_processes[start_index:end_index]]
+        elif process_type == 'memory':
+            paginated_processes = [to_memory_process(p) for p in all_processes[start_index:end_index]]
+        else:
+            paginated_processes = all_processes[start_index:end_index]
         
         # Calculate pagination metadata
         total_pages = (total_processes + page_size - 1) // page_size
@@ -121,12 +265,7 @@ def get_processes_by_category(process_type: str, page: int = 1, page_size: int =
         # Determine actual sort field used (resolve 'auto')
         actual_sort_by = sort_by
         if sort_by == 'auto':
-            sort_field_map = {
-                'cpu': 'cpu_percent',
-                'memory': 'memory_percent', 
-                'network': 'network_connections'
-            }
-            actual_sort_by = sort_field_map[process_type]
+            actual_sort_by = _AUTO_SORT_FIELDS[process_type]
         
         result = {
             "process_type": process_type,
@@ -146,313 +285,548 @@ def get_processes_by_category(process_type: str, page: int = 1, page_size: int =
             }
         }
         
-        return json.dumps(result, indent=2)
+        return to_json(result, pretty=pretty)
         
     except Exception as e:
-        return json.dumps({
+        return to_json({
             "error": f"Error retrieving {process_type} processes: {str(e)}"
         })
 
-@mcp.tool()
-def get_system_overview() -> str:
+@cached(DYNAMIC_TTL)
+def get_system_overview(pretty: bool = False) -> str:
     """
     Get comprehensive system overview with aggregate statistics similar to Activity Monitor.
     Provides CPU, memory, disk, network statistics, and performance analysis to help
     identify bottlenecks and optimization opportunities.
+
+    Args:
+        pretty: Indent the JSON output (default: False, compact output)
     
     Returns:
         JSON string containing system overview with performance metrics and analysis
     """
-    # Get comprehensive system data with per-category error handling
-    system_overview = {
-        "timestamp": get_current_timestamp(),
-        "cpu": safe_call(get_cpu_overview, "CPU overview failed"),
-        "memory": safe_call(get_memory_overview, "Memory overview failed"), 
-        "disk": safe_call(get_disk_overview, "Disk overview failed"),
-        "network": safe_call(get_network_overview, "Network overview failed"),
-        "system": safe_call(get_system_info, "System info failed"),
-        "performance_analysis": safe_call(analyze_system_performance, "Performance analysis failed")
-    }
+    timestamp = get_current_timestamp()
+
+    # Get comprehensive system data concurrently with per-category error handling
+    overview = gather_calls([
+        ("cpu", get_cpu_overview, "CPU overview failed"),
+        ("memory", get_memory_overview, "Memory overview failed"),
+        ("disk", get_disk_overview, "Disk overview failed"),
+        ("network", get_network_overview, "Network overview failed"),
+        ("system", get_system_info, "System info failed")
+    ])
+
+    # Analyze the already-collected metrics rather than probing again
+    system_overview = {"timestamp": timestamp, **overview}
+    system_overview["performance_analysis"] = safe_call(
+        lambda: analyze_system_performance(overview["cpu"], overview["memory"], overview["disk"]),
+        "Performance analysis failed"
+    )
     
-    return json.dumps(system_overview, indent=2)
+    return to_json(system_overview, pretty=pretty)
+
+def run_command(cmd, text=True):
+    """
+    Helper function to run a command and return its output.
 
-def run_command(cmd):
-    """Helper function to run a command and return its output."""
+    With text=False the raw stdout bytes are returned, skipping the decode for
+    large ASCII outputs that are parsed with bytes patterns.
+    """
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        result = subprocess.run(cmd, capture_output=True, text=text, timeout=10)
         return result.stdout.strip()
     except Exception as e:
-        return f"Error running command: {str(e)}"
+        message = f"Error running command: {str(e)}"
+        return message if text else message.encode()
 
-def get_cpu_intensive_processes(limit=5):
-    """Get the top CPU-consuming processes using ps command."""
-    output = run_command(["ps", "-eo", "pid,%cpu,comm", "-r"])
+@cached(STATIC_TTL)
+def run_static_command(*cmd):
+    """Run a command whose output does not change while the server is running."""
+    return run_command(list(cmd))
+
+def read_psutil_processes():
+    """Read the process table via psutil, or return None if it is not installed."""
+    if psutil is None:
+        return None
 
-    lines = output.split('\n')
     processes = []
+    # Pids whose stats are access denied
+    unreadable = []
+    # cpu_percent is measured since the previous call for each process, so the
+    # first snapshot after startup reports 0.0 for everything
+    for proc in psutil.process_iter(['pid', 'name', 'exe', 'cpu_percent', 'memory_percent', 'memory_info']):
+        info = proc.info
+        if info['memory_info'] is None:
+            # Access denied (typically another user's process); read it from ps below
+            unreadable.append(str(info['pid']))
+            continue
+        processes.append(ProcessRecord(
+            str(info['pid']),
+            round(info['cpu_percent'] or 0.0, 1),
+            round(info['memory_percent'] or 0.0, 1),
+            info['memory_info'].rss // 1024,
+            # Executable path like the libproc and ps backends, else the short name
+            info['exe'] or info['name'] or ''
+        ))
 
-    # Skip the header line
-    for line in lines[1:limit+1]:
-        parts = line.split(None, 2)
-        if len(parts) >= 3:
-            process = {
-                'pid': parts[0],
-                'cpu_percent': float(parts[1]),
-                'command': parts[2]
-            }
-            processes.append(process)
+    # The setuid ps can read root-owned processes such as WindowServer
+    processes.extend(read_ps_processes(unreadable))
 
     return processes
 
-def get_memory_intensive_processes(limit=5):
-    """Get the top memory-consuming processes using ps command."""
-    output = run_command(["ps", "-eo", "pid,pmem,rss,comm", "-m"])
+def read_psutil_connections():
+    """Count inet connections per process via psutil, or return None if unavailable."""
+    if psutil is None:
+        return None
+    try:
+        connections = psutil.net_connections(kind='inet')
+    except psutil.AccessDenied:
+        # macOS only allows listing other processes' sockets as root
+        return None
 
-    lines = output.split('\n')
+    # Most pids are already named by the cached process snapshot; only the
+    # rest (other users' processes) need a per-pid lookup
+    commands = {p.pid: os.path.basename(p.command) for p in snapshot_processes()}
     processes = []
+    for pid, count in Counter(c.pid for c in connections if c.pid).most_common():
+        pid = str(pid)
+        command = commands.get(pid)
+        if command is None:
+            try:
+                process = psutil.Process(int(pid))
+                command = psutil_process_name(process.pid, process.create_time())
+            except psutil.Error:
+                command = 'unknown'
+        processes.append({
+            'pid': pid,
+            'command': command,
+            'network_connections': count
+        })
 
-    # Skip the header line
-    for line in lines[1:limit+1]:
-        parts = line.split(None, 3)
-        if len(parts) >= 4:
-            process = {
-                'pid': parts[0],
-                'memory_percent': float(parts[1]),
-                'resident_memory_kb': int(parts[2]),
-                'command': parts[3]
-            }
-            processes.append(process)
+    return processes
+
+@functools.lru_cache(maxsize=1024)
+def psutil_process_name(pid, create_time):
+    """
+    Resolve a pid to its process name via psutil, remembering names across calls.
+
+    create_time is only part of the cache key, so a reused pid is not reported
+    under the name of the process that previously had it.
+    """
+    return psutil.Process(pid).name()
+
+def read_netstat_connections():
+    """
+    Count inet connections per process from a single netstat -anv, or return
+    None if the output has no pid column (the layout varies across macOS releases).
+    """
+    output = run_command(["netstat", "-anv"])
+
+    pid_offset = None
+    counts = Counter()
+    for line in output.splitlines():
+        if pid_offset is None:
+            if line.startswith('Proto'):
+                # Address columns have spaces in the header but not in the rows,
+                # so locate the pid column by its distance from the end
+                columns = line.split()
+                for i, column in enumerate(columns):
+                    if column in ('pid', 'process:pid'):
+                        pid_offset = len(columns) - i
+                        break
+                else:
+                    return None
+            continue
+
+        if line.startswith(('tcp', 'udp')):
+            # Only the trailing columns are needed, so stop splitting once past the pid
+            parts = line.rsplit(None, pid_offset)
+            if len(parts) >= pid_offset:
+                # Newer releases report "name:pid", older ones a bare pid
+                counts[parts[-pid_offset]] += 1
+
+    if pid_offset is None:
+        return None
+
+    commands = {p.pid: os.path.basename(p.command) for p in snapshot_processes()}
+    processes = []
+    for entry, count in counts.most_common():
+        name, _, pid = entry.rpartition(':')
+        if not pid.isdigit() or pid == '0':
+            continue
+        processes.append({
+            'pid': pid,
+            # netstat truncates names, and the row split keeps only the last
+            # word of names with spaces, so its name is only a last resort
+            'command': commands.get(pid) or name or 'unknown',
+            'network_connections': count
+        })
 
     return processes
 
+def read_libproc_processes():
+    """Read the process table directly via libproc, or return None if unavailable."""
+    if _libproc is None:
+        return None
+    try:
+        records, unreadable = _libproc.list_processes(ProcessRecord)
+    except OSError as e:
+        logging.warning("libproc process listing failed, falling back to ps: %s", e)
+        return None
+
+    # Other users' processes (WindowServer, mds_stores, ...) can't be read
+    # without root, but the setuid ps can, so fetch just those rows from it
+    records.extend(read_ps_processes([str(pid) for pid in unreadable]))
+    return records
+
+@cached(DYNAMIC_TTL)
+def snapshot_processes():
+    """
+    Snapshot the process table once for both the CPU and memory views.
+
+    Uses psutil or libproc when available, otherwise a single ps invocation.
+    Records are slotted ProcessRecords rather than dicts, since the snapshot
+    holds every process. The result is shared between callers for DYNAMIC_TTL
+    seconds and must not be mutated.
+    """
+    processes = read_psutil_processes()
+    if processes is None:
+        processes = read_libproc_processes()
+    if processes is not None:
+        return processes
+    return read_ps_processes()
+
+def read_ps_processes(pids=None):
+    """Parse process records from a single ps run, for every process or only the given pids."""
+    if pids is not None and not pids:
+        return []
+    selection = ["-p", ",".join(pids)] if pids is not None else ["-e"]
+    output = run_command(["ps", *selection, "-o", "pid,%cpu,pmem,rss,comm"], text=False)
+
+    # The header and any malformed lines simply don't match; only the command
+    # needs decoding, since float() and int() accept ASCII bytes directly
+    return [
+        ProcessRecord(m[1].decode(), float(m[2]), float(m[3]), int(m[4]), m[5].decode('utf-8', 'replace'))
+        for m in _PS_RE.finditer(output)
+    ]
+
+def count_processes():
+    """Count running processes without building full process records."""
+    if psutil is not None:
+        return len(psutil.pids())
+    if _libproc is not None:
+        try:
+            return _libproc.count_pids()
+        except OSError as e:
+            logging.warning("libproc pid count failed, falling back to snapshot: %s", e)
+    return len(snapshot_processes())
+
+def to_cpu_process(process):
+    """Project a full process record onto the CPU view fields."""
+    return {
+        'pid': process.pid,
+        'cpu_percent': process.cpu_percent,
+        'command': process.command
+    }
+
+def to_memory_process(process):
+    """Project a full process record onto the memory view fields."""
+    return {
+        'pid': process.pid,
+        'memory_percent': process.memory_percent,
+        'resident_memory_kb': process.resident_memory_kb,
+        'command': process.command
+    }
+
+def get_cpu_intensive_processes(limit=5):
+    """Get the top CPU-consuming processes."""
+    processes = heapq.nlargest(limit, snapshot_processes(), key=attrgetter('cpu_percent'))
+    return [to_cpu_process(p) for p in processes]
+
+def get_memory_intensive_processes(limit=5):
+    """Get the top memory-consuming processes."""
+    processes = heapq.nlargest(limit, snapshot_processes(), key=attrgetter('memory_percent'))
+    return [to_memory_process(p) for p in processes]
 
 def get_network_intensive_processes(limit=5):
     """Get processes with highest network activity."""
     try:
-        # Try using lsof to get network connections per process
-        output = run_command(["lsof", "-i", "-n", "-P"])
-
-        # Count connections by process
-        process_counts = {}
-        for line in output.split('\n')[1:]:  # Skip header
-            parts = line.split()
-            if len(parts) >= 9:
-                process = parts[0]
-                process_counts[process] = process_counts.get(process, 0) + 1
-
-        # Sort and get top processes
-        sorted_processes = sorted(process_counts.items(), key=lambda x: x[1], reverse=True)
-
-        processes = []
-        for i, (process, count) in enumerate(sorted_processes):
-            if i >= limit:
-                break
-
-            processes.append({
-                'command': process,
-                'network_connections': count
-            })
-
-        return processes
+        return [
+            {'command': p['command'], 'network_connections': p['network_connections']}
+            for p in snapshot_network_processes()[:limit]
+        ]
     except Exception as e:
         return [{"error": f"Could not determine network-intensive processes: {str(e)}"}]
 
 def get_all_cpu_processes():
     """Get all processes sorted by CPU usage."""
-    output = run_command(["ps", "-eo", "pid,%cpu,comm", "-r"])
-    
-    lines = output.split('\n')
-    processes = []
-    
-    # Skip the header line
-    for line in lines[1:]:
-        if line.strip():  # Skip empty lines
-            parts = line.split(None, 2)
-            if len(parts) >= 3:
-                try:
-                    process = {
-                        'pid': parts[0],
-                        'cpu_percent': float(parts[1]),
-                        'command': parts[2]
-                    }
-                    processes.append(process)
-                except ValueError:
-                    # Skip lines with invalid CPU values
-                    continue
-    
-    return processes
+    processes = sorted(snapshot_processes(), key=attrgetter('cpu_percent'), reverse=True)
+    return [to_cpu_process(p) for p in processes]
 
 def get_all_memory_processes():
     """Get all processes sorted by memory usage."""
-    output = run_command(["ps", "-eo", "pid,pmem,rss,comm", "-m"])
-    
-    lines = output.split('\n')
-    processes = []
-    
-    # Skip the header line
-    for line in lines[1:]:
-        if line.strip():  # Skip empty lines
-            parts = line.split(None, 3)
-            if len(parts) >= 4:
-                try:
-                    process = {
-                        'pid': parts[0],
-                        'memory_percent': float(parts[1]),
-                        'resident_memory_kb': int(parts[2]),
-                        'command': parts[3]
-                    }
-                    processes.append(process)
-                except ValueError:
-                    # Skip lines with invalid memory values
-                    continue
-    
-    return processes
+    processes = sorted(snapshot_processes(), key=attrgetter('memory_percent'), reverse=True)
+    return [to_memory_process(p) for p in processes]
 
 def get_all_network_processes():
-    """Get all processes with network activity sorted by connection count."""
+    """
+    Get all processes with network activity sorted by connection count.
+
+    Returns the shared cached snapshot, which must not be mutated.
+    """
     try:
-        # Try using lsof to get network connections per process
-        output = run_command(["lsof", "-i", "-n", "-P"])
-        
-        # Count connections by process and collect PIDs
-        process_counts = {}
-        process_pids = {}
-        
-        for line in output.split('\n')[1:]:  # Skip header
-            parts = line.split()
-            if len(parts) >= 9:
-                process = parts[0]
-                pid = parts[1] if len(parts) > 1 else "unknown"
-                
-                process_counts[process] = process_counts.get(process, 0) + 1
-                if process not in process_pids:
-                    process_pids[process] = pid
-        
-        # Sort and get all processes with network activity
-        sorted_processes = sorted(process_counts.items(), key=lambda x: x[1], reverse=True)
-        
-        processes = []
-        for process, count in sorted_processes:
-            processes.append({
-                'pid': process_pids.get(process, 'unknown'),
-                'command': process,
-                'network_connections': count
-            })
-        
-        return processes
+        return snapshot_network_processes()
     except Exception as e:
         return [{"error": f"Could not determine network processes: {str(e)}"}]
 
-def sort_processes(processes, process_type, sort_by, sort_order):
-    """Sort processes by the specified field and order."""
-    if not processes or 'error' in processes[0]:
+@cached(DYNAMIC_TTL)
+def snapshot_network_processes():
+    """
+    Count network connections per process, sorted by connection count.
+
+    Uses psutil when available, then netstat -anv, and finally lsof. The result is shared between
+    callers for DYNAMIC_TTL seconds and must not be mutated.
+    """
+    processes = read_psutil_connections()
+    if processes is None:
+        processes = read_netstat_connections()
+    if processes is not None:
+        return processes
+
+    # Fall back to lsof to get network connections per process. Field output
+    # (-F) prints one prefixed field per line: a "p<pid>" and "c<command>" pair
+    # per process, then "f<fd>" and "n<address>" for each of its sockets
+    output = run_command(["lsof", "-i", "-n", "-P", "-F", "pcn"])
+    
+    # Count connections by process and collect PIDs
+    process_counts = Counter()
+    process_pids = {}
+    pid = command = None
+    
+    for line in output.splitlines():
+        field = line[:1]
+        if field == 'p':
+            pid = line[1:]
+        elif field == 'c':
+            command = line[1:]
+            process_pids.setdefault(command, pid)
+        elif field == 'n' and command is not None:
+            process_counts[command] += 1
+    
+    processes = []
+    for process, count in process_counts.most_common():
+        processes.append({
+            'pid': process_pids.get(process, 'unknown'),
+            'command': process,
+            'network_connections': count
+        })
+    
+    return processes
+
+def get_process_records(process_type):
+    """Get the unprojected, unpaginated process records for a process type."""
+    if process_type == 'network':
+        return get_all_network_processes()
+    return snapshot_processes()
+
+def get_sorted_processes(process_type, sort_by, sort_order, needed=None):
+    """
+    Get (total, rows) for a process type: the record count and the records in
+    the requested order, both taken from the same snapshot.
+
+    CPU and memory records are the shared snapshot records, not projected onto
+    the view fields, so callers only build view dicts for the page they return.
+    Full sorts are kept until the snapshot refreshes, so successive pages of a
+    listing are slices of one sorted list. When the caller only needs the first
+    `needed` rows, those fall in the top quarter, and this snapshot has not been
+    fully sorted yet, they are selected with a heap instead.
+    """
+    processes = get_process_records(process_type)
+    total = len(processes)
+    if sort_by == 'auto':
+        if process_type == 'network':
+            # Already ordered by connection count
+            return total, processes
+        # Default to the primary metric, highest first
+        sort_by, sort_order = _AUTO_SORT_FIELDS[process_type], 'desc'
+
+    key = (process_type, sort_by, sort_order)
+    entry = _sorted_cache.get(key)
+    if entry is not None and entry[0] is processes:
+        return total, entry[1]
+
+    # Lexical command order gains little from a heap, so it is always fully sorted
+    if needed is not None and needed <= total // 4 and sort_by != 'command':
+        return total, sort_processes(processes, process_type, sort_by, sort_order, needed)
+
+    rows = sort_processes(processes, process_type, sort_by, sort_order)
+    _sorted_cache[key] = (processes, rows)
+    return total, rows
+
+def sort_processes(processes, process_type, sort_by, sort_order, limit=None):
+    """
+    Sort processes by the specified field and order.
+
+    If limit is given, only the first limit processes in that order are
+    returned, selected with a heap instead of sorting the whole list.
+    """
+    if not processes or (isinstance(processes[0], dict) and 'error' in processes[0]):
         return processes
     
     reverse_order = (sort_order == 'desc')
+    # Network rows are dicts; CPU and memory rows are ProcessRecords
+    field = itemgetter if process_type == 'network' else attrgetter
     
     try:
         if sort_by == 'pid':
-            # Convert PID to int for proper numeric sorting
-            def pid_key(p):
-                try:
-                    return int(p['pid'])
-                except (ValueError, TypeError):
-                    return 0
-            return sorted(processes, key=pid_key, reverse=reverse_order)
+            # Convert PID to int for proper numeric sorting ('unknown' sorts first)
+            get_pid = field('pid')
+            key = lambda p: int(get_pid(p)) if get_pid(p).isdigit() else -1
             
         elif sort_by == 'command':
-            return sorted(processes, key=lambda p: p.get('command', '').lower(), reverse=reverse_order)
-            
-        elif sort_by == 'cpu_percent':
-            return sorted(processes, key=lambda p: p.get('cpu_percent', 0), reverse=reverse_order)
-            
-        elif sort_by == 'memory_percent':
-            return sorted(processes, key=lambda p: p.get('memory_percent', 0), reverse=reverse_order)
+            get_command = field('command')
+            key = lambda p: get_command(p).lower()
             
-        elif sort_by == 'resident_memory_kb':
-            return sorted(processes, key=lambda p: p.get('resident_memory_kb', 0), reverse=reverse_order)
-            
-        elif sort_by == 'network_connections':
-            return sorted(processes, key=lambda p: p.get('network_connections', 0), reverse=reverse_order)
+        elif sort_by in ('cpu_percent', 'memory_percent', 'resident_memory_kb', 'network_connections'):
+            key = field(sort_by)
             
         else:
             # Fallback to default sorting if sort_by is not recognized
             return processes
+
+        # nlargest/nsmallest give the same result (ties included) as sorted()[:limit];
+        # lexical command order gains little from a heap, so it is always fully sorted
+        if limit is not None and sort_by != 'command':
+            select = heapq.nlargest if reverse_order else heapq.nsmallest
+            return select(limit, processes, key=key)
+
+        return sorted(processes, key=key, reverse=reverse_order)
             
     except Exception as e:
         # If sorting fails, return processes unsorted
-        logging.warning(f"Sorting failed: {e}")
+        logging.warning("Sorting failed: %s", e)
         return processes
 
 # ===== System Overview Helper Functions =====
 
+@cached(DYNAMIC_TTL)
+def get_uptime_info():
+    """
+    Run uptime once and parse the uptime, logged-in user count and load averages.
+
+    Shared by the CPU overview and system info so uptime is not re-run for each
+    field. Fields that cannot be parsed are omitted.
+    """
+    # Example: 10:15  up 3 days,  2:03, 2 users, load averages: 1.92 2.06 2.17
+    uptime_output = run_command(["uptime"])
+    uptime_info = {}
+
+    if 'up' in uptime_output:
+        uptime_info['uptime'] = uptime_output.split('up', 1)[1].split(',', 1)[0].strip()
+
+    users_match = _UPTIME_USERS_RE.search(uptime_output)
+    if users_match:
+        uptime_info['users'] = int(users_match.group(1))
+
+    load_match = _UPTIME_LOAD_RE.search(uptime_output)
+    if load_match:
+        uptime_info['load_average'] = {
+            '1min': float(load_match.group(1)),
+            '5min': float(load_match.group(2)),
+            '15min': float(load_match.group(3))
+        }
+
+    return uptime_info
+
 def get_current_timestamp():
     """Get current timestamp for system overview."""
     import datetime
     return datetime.datetime.now().isoformat()
 
+def read_mach_cpu_usage():
+    """Read CPU usage percentages from Mach host counters, or return None if unavailable."""
+    if _mach is None:
+        return None
+    try:
+        return _mach.cpu_usage()
+    except OSError as e:
+        logging.warning("Mach CPU counters failed, falling back to top: %s", e)
+        return None
+
+def read_top_cpu_usage():
+    """Parse CPU usage percentages and load average from one top sample."""
+    cpu_output = run_command(["top", "-l", "1", "-n", "0"])
+    cpu_info = {}
+
+    # Example: CPU usage: 12.34% user, 5.67% sys, 81.99% idle
+    cpu_match = _CPU_USAGE_RE.search(cpu_output)
+    if cpu_match:
+        cpu_info['user_percent'] = float(cpu_match.group(1))
+        cpu_info['system_percent'] = float(cpu_match.group(2))
+        cpu_info['idle_percent'] = float(cpu_match.group(3))
+
+    # Example: Load Avg: 7.95, 7.63, 8.14
+    load_match = _LOAD_AVG_RE.search(cpu_output)
+    if load_match:
+        cpu_info['load_average'] = {
+            '1min': float(load_match.group(1)),
+            '5min': float(load_match.group(2)),
+            '15min': float(load_match.group(3))
+        }
+
+    return cpu_info
+
+def read_mach_memory():
+    """Read VM page statistics (in bytes) from Mach, or return None if unavailable."""
+    if _mach is None:
+        return None
+    try:
+        page_size = _mach.page_size()
+        return {key: pages * page_size for key, pages in _mach.vm_page_counts().items()}
+    except OSError as e:
+        logging.warning("Mach VM statistics failed, falling back to vm_stat: %s", e)
+        return None
+
+def read_vm_stat_memory():
+    """Parse VM page statistics (in bytes) from vm_stat output."""
+    vm_output = run_command(["vm_stat"], text=False)
+
+    # vm_stat counts pages in the size it reports in its header, which can differ
+    # from ours (e.g. a 4096-byte page under Rosetta on a 16384-byte host)
+    header = _VM_STAT_PAGE_SIZE_RE.search(vm_output)
+    page_size = int(header[1]) if header else _PAGE_SIZE
+
+    # Parse vm_stat output, e.g. "Pages free:     12345.", converting pages to bytes
+    return {
+        key.decode().strip().lower().replace(' ', '_'): int(pages) * page_size
+        for key, pages in _VM_STAT_RE.findall(vm_output)
+    }
+
+@cached(DYNAMIC_TTL)
 def get_cpu_overview():
     """Get comprehensive CPU statistics."""
     try:
-        # Get CPU usage from top command
-        cpu_output = run_command(["top", "-l", "1", "-n", "0"])
-        cpu_info = {}
-        
-        # Parse CPU usage line and load average from top output
-        lines = cpu_output.split('\n')
-        for line in lines:
-            if 'CPU usage:' in line:
-                # Example: CPU usage: 12.34% user, 5.67% sys, 81.99% idle
-                try:
-                    parts = line.split(':')[1].strip()
-                    for part in parts.split(','):
-                        part = part.strip()
-                        if 'user' in part:
-                            cpu_info['user_percent'] = float(part.split('%')[0])
-                        elif 'sys' in part:
-                            cpu_info['system_percent'] = float(part.split('%')[0]) 
-                        elif 'idle' in part:
-                            cpu_info['idle_percent'] = float(part.split('%')[0])
-                except (ValueError, IndexError) as e:
-                    logging.warning(f"Could not parse CPU usage line: {line}. Error: {e}")
-                    continue
-            elif 'Load Avg:' in line:
-                # Example: Load Avg: 7.95, 7.63, 8.14 
-                try:
-                    load_part = line.split('Load Avg:')[1].strip()
-                    load_values = [float(x.strip()) for x in load_part.split(',')]
-                    cpu_info['load_average'] = {
-                        '1min': load_values[0] if len(load_values) > 0 else 0.0,
-                        '5min': load_values[1] if len(load_values) > 1 else 0.0,
-                        '15min': load_values[2] if len(load_values) > 2 else 0.0
-                    }
-                except (ValueError, IndexError) as e:
-                    logging.warning(f"Could not parse Load Avg line: {line}. Error: {e}")
+        # Get CPU usage straight from the Mach host counters when available
+        cpu_info = read_mach_cpu_usage()
+        if cpu_info is not None:
+            load_1min, load_5min, load_15min = os.getloadavg()
+            cpu_info['load_average'] = {
+                '1min': round(load_1min, 2),
+                '5min': round(load_5min, 2),
+                '15min': round(load_15min, 2)
+            }
+        else:
+            cpu_info = read_top_cpu_usage()
         
         # Fallback: Get load averages from uptime if not already parsed from top
         if 'load_average' not in cpu_info:
-            try:
-                uptime_output = run_command(["uptime"])
-                if 'load average' in uptime_output:
-                    load_part = uptime_output.split('load average:')[1].strip()
-                    load_averages = []
-                    for x in load_part.split(','):
-                        try:
-                            load_averages.append(float(x.strip()))
-                        except ValueError:
-                            load_averages.append(0.0)
-                    cpu_info['load_average'] = {
-                        '1min': load_averages[0] if len(load_averages) > 0 else 0.0,
-                        '5min': load_averages[1] if len(load_averages) > 1 else 0.0,
-                        '15min': load_averages[2] if len(load_averages) > 2 else 0.0
-                    }
-            except Exception as load_e:
-                cpu_info['load_average'] = {'1min': 0.0, '5min': 0.0, '15min': 0.0}
-                logging.warning(f"Could not parse load average: {load_e}")
+            cpu_info['load_average'] = get_uptime_info().get(
+                'load_average', {'1min': 0.0, '5min': 0.0, '15min': 0.0}
+            )
         
         # Get CPU core count
         try:
-            cores = run_command(["sysctl", "-n", "hw.ncpu"])
+            cores = run_static_command("sysctl", "-n", "hw.ncpu")
             cpu_info['cores'] = int(cores) if cores.isdigit() else 'unknown'
         except:
             cpu_info['cores'] = 'unknown'
@@ -466,31 +840,18 @@ def get_cpu_overview():
     except Exception as e:
         return {"error": f"Could not get CPU overview: {str(e)}"}
 
+@cached(DYNAMIC_TTL)
 def get_memory_overview():
     """Get comprehensive memory statistics."""
     try:
-        # Get memory info from vm_stat
-        vm_output = run_command(["vm_stat"])
-        memory_info = {}
-        
-        page_size = 4096  # Default page size on macOS
-        
-        # Parse vm_stat output
-        for line in vm_output.split('\n'):
-            if ':' in line:
-                parts = line.split(':')
-                if len(parts) == 2:
-                    key = parts[0].strip().lower().replace(' ', '_')
-                    value_str = parts[1].strip().rstrip('.')
-                    try:
-                        value = int(value_str) * page_size  # Convert pages to bytes
-                        memory_info[key] = value
-                    except ValueError:
-                        continue
+        # Get VM page statistics from Mach when available, otherwise vm_stat
+        memory_info = read_mach_memory()
+        if memory_info is None:
+            memory_info = read_vm_stat_memory()
         
         # Get total physical memory
         try:
-            total_mem = run_command(["sysctl", "-n", "hw.memsize"])
+            total_mem = run_static_command("sysctl", "-n", "hw.memsize")
             if total_mem.isdigit():
                 memory_info['total_physical_memory'] = int(total_mem)
         except:
@@ -521,77 +882,163 @@ def get_memory_overview():
     except Exception as e:
         return {"error": f"Could not get memory overview: {str(e)}"}
 
+@cached(DYNAMIC_TTL)
 def get_disk_overview():
     """Get disk usage statistics."""
     try:
-        # Get disk usage from df command
-        df_output = run_command(["df", "-h"])
         disk_info = {
             "filesystems": [],
             "summary": {}
         }
         
-        lines = df_output.split('\n')[1:]  # Skip header
-        total_size = 0
-        total_used = 0
-        total_available = 0
-        
-        for line in lines:
-            parts = line.split()
-            if len(parts) >= 8 and parts[0].startswith('/dev/'):
-                filesystem = {
-                    "filesystem": parts[0],
-                    "size": parts[1],
-                    "used": parts[2], 
-                    "available": parts[3],
-                    "use_percent": parts[4],
-                    "mounted_on": parts[8] if len(parts) > 8 else parts[-1]
-                }
-                
-                # Convert to bytes for summary (rough approximation)
-                size_str = parts[1]
-                used_str = parts[2]
-                
-                try:
-                    if size_str.endswith('Gi'):
-                        total_size += float(size_str[:-2]) * 1024**3
-                    elif size_str.endswith('Ti'):
-                        total_size += float(size_str[:-2]) * 1024**4
-                    elif size_str.endswith('G'):
-                        total_size += float(size_str[:-1]) * 1024**3
-                    elif size_str.endswith('T'):
-                        total_size += float(size_str[:-1]) * 1024**4
-                except (ValueError, IndexError):
-                    pass
-                    
-                try:
-                    if used_str.endswith('Gi'):
-                        total_used += float(used_str[:-2]) * 1024**3
-                    elif used_str.endswith('Ti'):
-                        total_used += float(used_str[:-2]) * 1024**4
-                    elif used_str.endswith('G'):
-                        total_used += float(used_str[:-1]) * 1024**3
-                    elif used_str.endswith('T'):
-                        total_used += float(used_str[:-1]) * 1024**4
-                except (ValueError, IndexError):
-                    pass
-                
-                disk_info["filesystems"].append(filesystem)
+        # Each filesystem is (device, size_kb, used_kb, available_kb, use_percent, mounted_on)
+        filesystems = read_psutil_filesystems()
+        if filesystems is None:
+            filesystems = read_df_filesystems()
+        
+        total_size_kb = 0
+        total_used_kb = 0
+        total_available_kb = 0
+        
+        for device, size_kb, used_kb, available_kb, use_percent, mounted_on in filesystems:
+            disk_info["filesystems"].append({
+                "filesystem": device,
+                "size_gb": round(size_kb / 1024**2, 2),
+                "used_gb": round(used_kb / 1024**2, 2),
+                "available_gb": round(available_kb / 1024**2, 2),
+                "use_percent": use_percent,
+                "mounted_on": mounted_on
+            })
+
+            total_size_kb += size_kb
+            total_used_kb += used_kb
+            total_available_kb += available_kb
         
         # Calculate summary
-        if total_size > 0:
+        if total_size_kb > 0:
             disk_info["summary"] = {
-                "total_size_gb": round(total_size / 1024**3, 2),
-                "total_used_gb": round(total_used / 1024**3, 2),
-                "total_available_gb": round((total_size - total_used) / 1024**3, 2),
-                "overall_usage_percent": round((total_used / total_size) * 100, 2)
+                "total_size_gb": round(total_size_kb / 1024**2, 2),
+                "total_used_gb": round(total_used_kb / 1024**2, 2),
+                "total_available_gb": round(total_available_kb / 1024**2, 2),
+                "overall_usage_percent": round((total_used_kb / total_size_kb) * 100, 2)
             }
+
+        io_rates = read_psutil_disk_io()
+        if io_rates is not None:
+            disk_info["io"] = io_rates
         
         return disk_info
         
     except Exception as e:
         return {"error": f"Could not get disk overview: {str(e)}"}
 
+def read_psutil_filesystems():
+    """Read usage of /dev/ filesystems via psutil, or return None if it is not installed."""
+    if psutil is None:
+        return None
+
+    filesystems = []
+    for partition in psutil.disk_partitions(all=False):
+        if not partition.device.startswith('/dev/'):
+            continue
+        try:
+            usage = psutil.disk_usage(partition.mountpoint)
+        except OSError:
+            # e.g. a volume that was unmounted or is not readable
+            continue
+        filesystems.append((
+            partition.device,
+            usage.total // 1024,
+            usage.used // 1024,
+            usage.free // 1024,
+            f"{math.ceil(usage.percent)}%",  # df rounds capacity up
+            partition.mountpoint
+        ))
+
+    return filesystems
+
+def read_psutil_disk_io():
+    """
+    Read disk throughput since the previous call via psutil, or return None if unavailable.
+
+    The first call only records a sample and returns None, since there is
+    nothing to diff against yet and zero rates would look like an idle disk.
+    """
+    global _last_disk_io
+
+    if psutil is None:
+        return None
+    counters = psutil.disk_io_counters()
+    if counters is None:
+        # No disks psutil can read counters for
+        return None
+
+    sample = (time.monotonic(), counters.read_bytes, counters.write_bytes)
+    previous = _last_disk_io
+    _last_disk_io = sample
+    if previous is None:
+        return None
+
+    elapsed = sample[0] - previous[0]
+    if elapsed <= 0:
+        return {"read_mb_per_sec": 0.0, "write_mb_per_sec": 0.0}
+    return {
+        "read_mb_per_sec": round((sample[1] - previous[1]) / 1024**2 / elapsed, 2),
+        "write_mb_per_sec": round((sample[2] - previous[2]) / 1024**2 / elapsed, 2)
+    }
+
+def read_df_filesystems():
+    """Parse usage of /dev/ filesystems from df -k -P output."""
+    # POSIX format with 1K blocks, so sizes are plain integers
+    # Columns: Filesystem 1024-blocks Used Available Capacity Mounted-on
+    df_output = run_command(["df", "-k", "-P"])
+    filesystems = []
+
+    for line in df_output.split('\n')[1:]:  # Skip header
+        parts = line.split(None, 5)  # Mount points may contain spaces
+        if len(parts) == 6 and parts[0].startswith('/dev/'):
+            try:
+                filesystems.append((parts[0], int(parts[1]), int(parts[2]), int(parts[3]), parts[4], parts[5]))
+            except ValueError:
+                continue
+
+    return filesystems
+
+def read_iflist_interfaces():
+    """Read per-interface counters via sysctl NET_RT_IFLIST2, or return None if unavailable."""
+    if _iflist is None:
+        return None
+    try:
+        return _iflist.interface_counters()
+    except OSError as e:
+        logging.warning("NET_RT_IFLIST2 sysctl failed, falling back to netstat: %s", e)
+        return None
+
+def read_netstat_interfaces():
+    """Parse per-interface counters from netstat -i output."""
+    netstat_output = run_command(["netstat", "-i"])
+    lines = netstat_output.split('\n')[1:]  # Skip header
+    interfaces = {}
+
+    # Report integers like the sysctl path; netstat prints "-" for unknown counts
+    def counter(value):
+        return int(value) if value.isdigit() else 0
+
+    for line in lines:
+        parts = line.split()
+        if len(parts) >= 10 and not parts[0].startswith('Name'):
+            interface_name = parts[0]
+            interfaces[interface_name] = {
+                "packets_in": counter(parts[4]),
+                "errors_in": counter(parts[5]),
+                "packets_out": counter(parts[7]),
+                "errors_out": counter(parts[8]),
+                "collisions": counter(parts[9])
+            }
+
+    return interfaces
+
+@cached(DYNAMIC_TTL)
 def get_network_overview():
     """Get network statistics and active connections."""
     try:
@@ -603,28 +1050,20 @@ def get_network_overview():
         
         # Get network interface statistics
         try:
-            netstat_output = run_command(["netstat", "-i"])
-            lines = netstat_output.split('\n')[1:]  # Skip header
-            
-            for line in lines:
-                parts = line.split()
-                if len(parts) >= 10 and not parts[0].startswith('Name'):
-                    interface_name = parts[0]
-                    network_info["interfaces"][interface_name] = {
-                        "packets_in": parts[4],
-                        "errors_in": parts[5],
-                        "packets_out": parts[7],
-                        "errors_out": parts[8],
-                        "collisions": parts[9] if len(parts) > 9 else "0"
-                    }
+            interfaces = read_iflist_interfaces()
+            if interfaces is None:
+                interfaces = read_netstat_interfaces()
+            network_info["interfaces"] = interfaces
         except:
             pass
         
         # Get active network connections count by type
         try:
             netstat_connections = run_command(["netstat", "-an"])
-            tcp_count = netstat_connections.count('tcp4') + netstat_connections.count('tcp6')
-            udp_count = netstat_connections.count('udp4') + netstat_connections.count('udp6')
+            # Count protocols in one pass over the line prefixes (tcp46 counts as tcp4)
+            protocol_counts = Counter(line[:4] for line in netstat_connections.splitlines())
+            tcp_count = protocol_counts['tcp4'] + protocol_counts['tcp6']
+            udp_count = protocol_counts['udp4'] + protocol_counts['udp6']
             
             network_info["connections"] = {
                 "tcp_connections": tcp_count,
@@ -646,6 +1085,7 @@ def get_network_overview():
     except Exception as e:
         return {"error": f"Could not get network overview: {str(e)}"}
 
+@cached(DYNAMIC_TTL)
 def get_system_info():
     """Get general system information."""
     try:
@@ -653,34 +1093,30 @@ def get_system_info():
         
         # Get system uptime
         try:
-            uptime_output = run_command(["uptime"])
-            if 'up' in uptime_output:
-                system_info['uptime'] = uptime_output.split('up')[1].split(',')[0].strip()
+            uptime_info = get_uptime_info()
+            if 'uptime' in uptime_info:
+                system_info['uptime'] = uptime_info['uptime']
         except:
             pass
         
         # Get macOS version
         try:
-            version_output = run_command(["sw_vers", "-productVersion"])
+            version_output = run_static_command("sw_vers", "-productVersion")
             system_info['macos_version'] = version_output.strip()
         except:
             pass
         
-        # Get system load and user count from uptime
+        # Get user count from the same uptime output
         try:
-            uptime_output = run_command(["uptime"])
-            if 'user' in uptime_output:
-                users_part = uptime_output.split('load average')[0]
-                if 'user' in users_part:
-                    user_count = users_part.split('user')[0].split()[-1]
-                    system_info['logged_in_users'] = int(user_count) if user_count.isdigit() else 1
+            uptime_info = get_uptime_info()
+            if 'users' in uptime_info:
+                system_info['logged_in_users'] = uptime_info['users']
         except:
             pass
         
         # Get total process count
         try:
-            process_count = len(get_all_cpu_processes())
-            system_info['total_processes'] = process_count
+            system_info['total_processes'] = count_processes()
         except:
             pass
         
@@ -689,8 +1125,13 @@ def get_system_info():
     except Exception as e:
         return {"error": f"Could not get system info: {str(e)}"}
 
-def analyze_system_performance():
-    """Analyze system performance and identify potential bottlenecks."""
+def analyze_system_performance(cpu_info=None, memory_info=None, disk_info=None):
+    """
+    Analyze system performance and identify potential bottlenecks.
+
+    Already-collected CPU, memory and disk overviews can be passed in;
+    any that are omitted are fetched.
+    """
     try:
         analysis = {
             "status": "unknown",
@@ -699,10 +1140,13 @@ def analyze_system_performance():
             "performance_score": 0
         }
         
-        # Get current system metrics for analysis
-        cpu_info = get_cpu_overview()
-        memory_info = get_memory_overview()
-        disk_info = get_disk_overview()
+        # Get current system metrics for analysis if not provided
+        if cpu_info is None:
+            cpu_info = get_cpu_overview()
+        if memory_info is None:
+            memory_info = get_memory_overview()
+        if disk_info is None:
+            disk_info = get_disk_overview()
         
         score = 100  # Start with perfect score
         
@@ -736,6 +1180,12 @@ def analyze_system_performance():
             elif memory_usage > 70:
                 analysis["recommendations"].append("Monitor memory usage and consider upgrading RAM")
                 score -= 5
+
+            if memory_usage > 70:
+                for app, percent in find_memory_hogs():
+                    analysis["recommendations"].append(
+                        f"{app} processes are using {percent}% of memory; consider closing unused windows or tabs"
+                    )
         
         # Analyze disk usage
         if isinstance(disk_info, dict) and 'summary' in disk_info:
@@ -769,14 +1219,68 @@ def analyze_system_performance():
     except Exception as e:
         return {"error": f"Could not analyze system performance: {str(e)}"}
 
+def find_memory_hogs():
+    """
+    Sum memory usage of known memory-hungry apps, as (app, percent) pairs, highest first.
+
+    Only the largest few apps above _MEMORY_HOG_MIN_PERCENT are returned.
+    """
+    usage = Counter()
+    for process in snapshot_processes():
+        # Match the executable name only, not the directories above it
+        match = _MEMORY_HOG_RE.search(os.path.basename(process.command))
+        if match:
+            usage[match[0]] += process.memory_percent
+    return [
+        (app, round(percent, 1))
+        for app, percent in usage.most_common(_MEMORY_HOG_LIMIT)
+        if percent >= _MEMORY_HOG_MIN_PERCENT
+    ]
+
+def prime_samples():
+    """
+    Take throwaway CPU and disk I/O samples at startup.
+
+    psutil, libproc and Mach CPU figures and disk throughput are measured since
+    the previous read, so without this the first tool call would report zeros
+    (psutil) or lifetime averages (libproc, Mach) instead of recent usage, and
+    no disk throughput at all.
+    """
+    if read_psutil_processes() is None:
+        read_libproc_processes()
+    read_mach_cpu_usage()
+    read_psutil_disk_io()
+
+
+# ===== MCP Server =====
+def get_mcp():
+    """Create the FastMCP server and register the tools on first call."""
+    global _mcp
+    if _mcp is None:
+        from mcp.server.fastmcp import FastMCP
+
+        server = FastMCP("Simple MacOS Resource Monitor")
+        for tool in (get_resource_intensive_processes, get_processes_by_category, get_system_overview):
+            server.tool()(tool)
+        _mcp = server
+    return _mcp
+
+def __getattr__(name):
+    # Keep `from mac_monitor.monitor import mcp` (and MCP dev tooling that looks
+    # up the server object by name) working without importing FastMCP eagerly
+    if name == "mcp":
+        return get_mcp()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # ===== Main Function =====
 def main():
     """Main entry point for the MCP server."""
     print("Simple MacOS Resource Monitor MCP server starting...")
     print("Monitoring CPU, Memory, and Network resource usage...")
+    prime_samples()
     # Run the MCP server (this will block until exit)
-    mcp.run()
+    get_mcp().run()
 
 if __name__ == "__main__":
     main()